@@ -5,19 +5,37 @@ Displays a retro-style 7-segment clock with configurable time formats
 and customizable colors.
 """
 
+import logging
 import os
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
-from datetime import datetime
-import pytz
+from typing import Dict, Any, List, Optional, Tuple, Union
+from datetime import datetime, timezone, tzinfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+import numpy as np
 from PIL import Image, ImageDraw
 
 from src.plugin_system.base_plugin import BasePlugin
 
+# Resampling filters for the "resample" option
+try:
+    # Try new PIL API first
+    RESAMPLE_FILTERS = {"nearest": Image.Resampling.NEAREST, "lanczos": Image.Resampling.LANCZOS}
+except AttributeError:
+    # Fall back to old PIL API
+    RESAMPLE_FILTERS = {"nearest": Image.NEAREST, "lanczos": Image.LANCZOS}
+
 
 class SevenSegmentClockPlugin(BasePlugin):
     """7-segment clock plugin with customizable colors."""
 
+    # Zero-padded two-digit strings for 0-59, used instead of strftime
+    _TWO_DIGITS = tuple(f"{i:02d}" for i in range(60))
+
+    # Maximum number of composed frames kept in the frame cache
+    _FRAME_CACHE_SIZE = 64
+
     def __init__(
         self,
         plugin_id: str,
@@ -39,6 +57,12 @@ class SevenSegmentClockPlugin(BasePlugin):
         self.has_flashing_separator = config.get("has_flashing_separator", True)
         self.color = self._hex_to_rgb(config.get("color", "#FFFFFF"))
         self.digit_spacing = config.get("digit_spacing", 2)  # Pixels between digits
+        self.resample = config.get("resample", "nearest")  # Scaling filter for glyphs
+        self.resample_filter = (
+            RESAMPLE_FILTERS.get(self.resample, RESAMPLE_FILTERS["nearest"])
+            if isinstance(self.resample, str)
+            else RESAMPLE_FILTERS["nearest"]
+        )
 
         # Initialize timezone (inherits from main config if not specified)
         self._init_timezone()
@@ -50,14 +74,45 @@ class SevenSegmentClockPlugin(BasePlugin):
         # State variables (updated in update(), used in display())
         self.current_time: Optional[datetime] = None
         self.last_displayed_time_str: Optional[str] = None
+        # (time_str, separator_visible, color) of the last rendered frame
+        self.last_render_key: Optional[Tuple[str, bool, Tuple[int, int, int]]] = None
+        self._cached_minute_epoch: Optional[int] = None  # UTC minutes since epoch
         self.first_display: bool = True
 
+        # Colored/scaled glyph cache keyed by (digit or ":", color, scale).
+        # Rebuilt by _build_render_cache() when the color or scale changes.
+        self._render_cache: Dict[
+            Tuple[Union[int, str], Tuple[int, int, int], float], Optional[Image.Image]
+        ] = {}
+        self._cache_key_color: Optional[Tuple[int, int, int]] = None
+
+        # Composed frames keyed by (time_str, separator_visible, color,
+        # display_width, display_height), least recently used first
+        self._frame_cache: "OrderedDict[Tuple[str, bool, Tuple[int, int, int], int, int], Image.Image]" = (
+            OrderedDict()
+        )
+
+        # Scale factors keyed by (display_width, display_height, num_digits, has_separator)
+        self._scale_cache: Dict[Tuple[int, int, int, bool], float] = {}
+
         # Image dimensions (from loaded images)
         self.digit_width = 13
         self.digit_height = 32
         self.separator_width = 4
         self.separator_height = 14
 
+        # Lit-segment templates of the loaded images, used for recoloring
+        self.digit_templates = self._build_digit_templates()
+        self.separator_template: Optional[np.ndarray] = (
+            self._lit_template(np.asarray(self.separator_image))
+            if self.separator_image is not None
+            else None
+        )
+
+        # Validate once up front so configuration warnings are only logged once
+        self._config_valid: Optional[bool] = None
+        self.validate_config()
+
         self.logger.info("7-segment clock plugin initialized")
 
     def _init_timezone(self) -> None:
@@ -74,12 +129,38 @@ class SevenSegmentClockPlugin(BasePlugin):
         if not timezone_str:
             timezone_str = "UTC"
         
-        try:
-            self.timezone = pytz.timezone(timezone_str)
-            self.logger.debug(f"Using timezone: {timezone_str}")
-        except pytz.exceptions.UnknownTimeZoneError:
+        resolved = self._resolve_timezone(timezone_str)
+        if resolved is not None:
+            self.timezone = resolved
+            self.logger.debug("Using timezone: %s", resolved)
+        else:
             self.logger.warning(f"Unknown timezone '{timezone_str}', using UTC")
-            self.timezone = pytz.UTC
+            self.timezone = timezone.utc
+
+    @staticmethod
+    def _resolve_timezone(timezone_str: Any) -> Optional[tzinfo]:
+        """
+        Look up a timezone by name, ignoring case (as pytz did).
+
+        Args:
+            timezone_str: Timezone name (e.g., US/Eastern, america/new_york)
+
+        Returns:
+            ZoneInfo for the timezone, or None if the name is not a known timezone
+        """
+        if not isinstance(timezone_str, str):
+            return None
+
+        try:
+            return ZoneInfo(timezone_str)
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+
+        # Zone keys are case-sensitive file names, so fall back to a
+        # case-insensitive match against the installed zones
+        names = {name.lower(): name for name in available_timezones()}
+        name = names.get(timezone_str.lower())
+        return ZoneInfo(name) if name else None
     
     def _get_global_timezone(self) -> str:
         """Get the global timezone from the main LEDMatrix config."""
@@ -89,25 +170,26 @@ class SevenSegmentClockPlugin(BasePlugin):
                 main_config = self.plugin_manager.config_manager.load_config()
                 return main_config.get('timezone', 'UTC')
         except Exception as e:
-            self.logger.debug(f"Could not load timezone from main config: {e}")
+            self.logger.debug("Could not load timezone from main config: %s", e)
         return None
 
-    def _load_number_images(self) -> Dict[int, Image.Image]:
-        """Load all number digit images (0-9)."""
-        images = {}
+    def _load_number_images(self) -> List[Optional[Image.Image]]:
+        """Load all number digit images (0-9), indexed by digit (None if missing)."""
+        images: List[Optional[Image.Image]] = [None] * 10
         for i in range(10):
             image_path = self.assets_dir / f"number_{i}.png"
             try:
                 if image_path.exists():
                     images[i] = Image.open(image_path).convert("RGBA")
-                    self.logger.debug(f"Loaded number image: {i}")
+                    self.logger.debug("Loaded number image: %s", i)
                 else:
                     self.logger.warning(f"Number image not found: {image_path}")
             except Exception as e:
                 self.logger.error(f"Error loading number image {i}: {e}")
         
-        if len(images) != 10:
-            self.logger.error(f"Only loaded {len(images)}/10 number images")
+        loaded = sum(1 for image in images if image is not None)
+        if loaded != 10:
+            self.logger.error(f"Only loaded {loaded}/10 number images")
         
         return images
 
@@ -126,6 +208,41 @@ class SevenSegmentClockPlugin(BasePlugin):
             self.logger.error(f"Error loading separator image: {e}")
             return None
 
+    @staticmethod
+    def _lit_template(pixels: np.ndarray) -> np.ndarray:
+        """
+        Get the lit-segment template of RGBA pixels.
+
+        A pixel is a lit segment if it has any alpha and is not pure black.
+        The template is 1 in every RGB channel of lit pixels and 0 elsewhere, so
+        multiplying it by an RGB color yields the colored glyph on black.
+        """
+        lit = (pixels[..., 3] > 0) & pixels[..., :3].any(axis=-1)
+        return np.repeat(lit[..., np.newaxis].astype(np.uint8), 3, axis=-1)
+
+    def _build_digit_templates(self) -> np.ndarray:
+        """
+        Stack the loaded digit images into a single lit-segment template.
+
+        Returns:
+            Lit-segment templates of all digits, shape (10, height, width, 3)
+        """
+        digit_pixels = np.zeros((10, self.digit_height, self.digit_width, 4), dtype=np.uint8)
+        for digit, image in enumerate(self.number_images):
+            if image is None:
+                continue
+            pixels = np.asarray(image)
+            if pixels.shape != digit_pixels.shape[1:]:
+                self.logger.error(
+                    f"Number image {digit} is {image.width}x{image.height}, "
+                    f"expected {self.digit_width}x{self.digit_height}"
+                )
+                self.number_images[digit] = None
+                continue
+            digit_pixels[digit] = pixels
+
+        return self._lit_template(digit_pixels)
+
     def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
         """Convert hex color string to RGB tuple."""
         # Remove # if present
@@ -135,9 +252,17 @@ class SevenSegmentClockPlugin(BasePlugin):
         if len(hex_color) == 3:
             hex_color = "".join(c * 2 for c in hex_color)
         
-        # Convert to RGB
+        # Fast path: plain 6-digit hex decodes in a single C call
+        try:
+            rgb = bytes.fromhex(hex_color) if len(hex_color) == 6 else b""
+        except ValueError:
+            rgb = b""
+        if len(rgb) == 3:
+            return (rgb[0], rgb[1], rgb[2])
+
+        # Convert to RGB (clamped, since int() accepts signs like "-1")
         try:
-            return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+            return tuple(max(0, min(255, int(hex_color[i : i + 2], 16))) for i in (0, 2, 4))
         except (ValueError, IndexError):
             self.logger.warning(f"Invalid hex color '{hex_color}', using white")
             return (255, 255, 255)
@@ -158,89 +283,83 @@ class SevenSegmentClockPlugin(BasePlugin):
             - time_string: Formatted time (e.g., "12:34" or "09:05")
             - separator_visible: Whether separator should be visible (for flashing)
         """
-        if self.is_24_hour_format:
-            hour_str = dt.strftime("%H")
-        else:
-            hour_str = dt.strftime("%I")  # 12-hour format with leading zero
-            if not self.has_leading_zero and hour_str[0] == "0":
-                hour_str = hour_str[1:]  # Remove leading zero
-        
-        if not self.has_leading_zero and self.is_24_hour_format and hour_str[0] == "0":
-            hour_str = hour_str[1:]  # Remove leading zero for 24-hour format too
+        hour = dt.hour
+        if not self.is_24_hour_format:
+            hour = hour % 12 or 12  # 0-23 -> 12, 1-11, 12, 1-11
 
-        minute_str = dt.strftime("%M")
+        hour_str = self._TWO_DIGITS[hour]
+        if not self.has_leading_zero and hour_str[0] == "0":
+            hour_str = hour_str[1:]  # Remove leading zero
 
-        # Determine separator visibility for flashing
-        separator_visible = True
-        if self.has_flashing_separator:
-            # Flash on even seconds (separator visible on 0, 2, 4, etc.)
-            separator_visible = (dt.second % 2) == 0
+        minute_str = self._TWO_DIGITS[dt.minute]
+
+        # Flash on even seconds (separator visible on 0, 2, 4, etc.)
+        separator_visible = not (self.has_flashing_separator and dt.second & 1)
 
         return f"{hour_str}:{minute_str}", separator_visible
 
-    def _render_digit(
-        self, digit: int, color: Tuple[int, int, int], scale: float = 1.0
-    ) -> Optional[Image.Image]:
+    def _colorize(self, template: np.ndarray, color: Tuple[int, int, int]) -> np.ndarray:
         """
-        Render a single digit with the specified color.
+        Apply a color to the lit segments of one or more glyphs.
 
         Args:
-            digit: Digit to render (0-9)
+            template: Lit-segment template (..., height, width, 3) of the base glyphs
             color: RGB color tuple
-            scale: Scale factor to apply to the image (default: 1.0)
 
         Returns:
-            PIL Image with colored digit, or None if error
+            RGB pixel array (..., height, width, 3) with the colored glyphs
         """
-        if digit not in self.number_images:
-            self.logger.warning(f"Digit image not available: {digit}")
-            return None
+        # Lit segments get the configured color; everything else stays black
+        return template * np.array(color, dtype=np.uint8)
 
-        # Get the base image (transparent foreground on black background)
-        base_image = self.number_images[digit].copy()
+    def _to_scaled_image(self, colored: np.ndarray, scale: float = 1.0) -> Image.Image:
+        """
+        Convert a colored glyph's pixel array to a PIL Image and scale it.
 
-        # Create a colored version with transparent background
-        # The images have white/colored pixels for lit segments on transparent/black background
-        colored_image = Image.new("RGBA", base_image.size, (0, 0, 0, 0))
-        
-        # Apply color to visible pixels (non-transparent pixels that represent lit segments)
-        for x in range(base_image.width):
-            for y in range(base_image.height):
-                pixel = base_image.getpixel((x, y))
-                if len(pixel) == 4:  # RGBA
-                    r, g, b, a = pixel
-                    # If pixel has any alpha and is not pure black, it's a lit segment
-                    # Apply the configured color to lit segments
-                    if a > 0 and (r, g, b) != (0, 0, 0):
-                        # This is a lit segment - apply the configured color with full opacity
-                        colored_image.putpixel((x, y), (*color, 255))
-                    else:
-                        # Black or transparent pixel - keep fully transparent
-                        colored_image.putpixel((x, y), (0, 0, 0, 0))
-                else:
-                    # Not RGBA format - convert and handle
-                    if pixel != (0, 0, 0):  # Not black
-                        colored_image.putpixel((x, y), (*color, 255))
-                    else:
-                        colored_image.putpixel((x, y), (0, 0, 0, 0))
+        Args:
+            colored: RGB pixel array (height, width, 3)
+            scale: Scale factor to apply to the image (default: 1.0)
 
-        # Scale the image if needed
+        Returns:
+            PIL Image with the colored glyph on a black background
+        """
+        colored_image = Image.fromarray(colored, "RGB")
+
+        # Scale the image if needed (nearest keeps the segment edges crisp)
         if scale != 1.0:
             new_width = int(colored_image.width * scale)
             new_height = int(colored_image.height * scale)
-            try:
-                # Try new PIL API first
-                colored_image = colored_image.resize(
-                    (new_width, new_height), Image.Resampling.LANCZOS
-                )
-            except AttributeError:
-                # Fall back to old PIL API
-                colored_image = colored_image.resize(
-                    (new_width, new_height), Image.LANCZOS
-                )
+            colored_image = colored_image.resize((new_width, new_height), self.resample_filter)
 
         return colored_image
 
+    def _render_digits(
+        self, digits: List[int], color: Tuple[int, int, int], scale: float = 1.0
+    ) -> List[Optional[Image.Image]]:
+        """
+        Render several digits with the specified color in a single pass.
+
+        Args:
+            digits: Digits to render (0-9)
+            color: RGB color tuple
+            scale: Scale factor to apply to the images (default: 1.0)
+
+        Returns:
+            List of PIL Images with colored digits (None where a digit is unavailable)
+        """
+        # One vectorized fill colors every requested digit at once
+        colored = self._colorize(self.digit_templates[digits], color)
+
+        images: List[Optional[Image.Image]] = []
+        for i, digit in enumerate(digits):
+            if self.number_images[digit] is None:
+                self.logger.warning(f"Digit image not available: {digit}")
+                images.append(None)
+            else:
+                images.append(self._to_scaled_image(colored[i], scale))
+
+        return images
+
     def _render_separator(
         self, color: Tuple[int, int, int], scale: float = 1.0
     ) -> Optional[Image.Image]:
@@ -254,59 +373,54 @@ class SevenSegmentClockPlugin(BasePlugin):
         Returns:
             PIL Image with colored separator, or None if error
         """
-        if self.separator_image is None:
+        if self.separator_template is None:
             return None
 
-        # Similar to digit rendering
-        base_image = self.separator_image.copy()
-        colored_image = Image.new("RGBA", base_image.size, (0, 0, 0, 0))
-
-        for x in range(base_image.width):
-            for y in range(base_image.height):
-                pixel = base_image.getpixel((x, y))
-                if len(pixel) == 4:  # RGBA
-                    r, g, b, a = pixel
-                    # If pixel has any alpha and is not pure black, it's a lit segment
-                    if a > 0 and (r, g, b) != (0, 0, 0):
-                        # This is a lit segment - apply the configured color with full opacity
-                        colored_image.putpixel((x, y), (*color, 255))
-                    else:
-                        # Black or transparent pixel - keep fully transparent
-                        colored_image.putpixel((x, y), (0, 0, 0, 0))
-                else:
-                    # Not RGBA format - convert and handle
-                    if pixel != (0, 0, 0):  # Not black
-                        colored_image.putpixel((x, y), (*color, 255))
-                    else:
-                        colored_image.putpixel((x, y), (0, 0, 0, 0))
+        return self._to_scaled_image(self._colorize(self.separator_template, color), scale)
 
-        # Scale the image if needed
-        if scale != 1.0:
-            new_width = int(colored_image.width * scale)
-            new_height = int(colored_image.height * scale)
-            try:
-                # Try new PIL API first
-                colored_image = colored_image.resize(
-                    (new_width, new_height), Image.Resampling.LANCZOS
-                )
-            except AttributeError:
-                # Fall back to old PIL API
-                colored_image = colored_image.resize(
-                    (new_width, new_height), Image.LANCZOS
-                )
+    def _build_render_cache(self, color: Tuple[int, int, int], scale: float) -> None:
+        """
+        Render every digit and the separator once for the given color and scale.
 
-        return colored_image
+        Entries for other scales are kept (the scale only differs between a few
+        layouts), but the whole cache is dropped when the color changes.
+
+        Args:
+            color: RGB color tuple
+            scale: Scale factor to apply to the images
+        """
+        if color != self._cache_key_color:
+            self._render_cache.clear()
+            self._frame_cache.clear()
+            self._cache_key_color = color
+
+        digits = list(range(10))
+        for digit, image in zip(digits, self._render_digits(digits, color, scale)):
+            self._render_cache[(digit, color, scale)] = image
+        self._render_cache[(":", color, scale)] = self._render_separator(color, scale)
+
+        self.logger.debug("Built render cache: color=%s, scale=%.3f", color, scale)
 
     def update(self) -> None:
         """Update current time."""
         try:
-            # Get current time in configured timezone
-            now_utc = datetime.now(pytz.UTC)
-            self.current_time = now_utc.astimezone(self.timezone)
+            now = int(time.time())
+            minute_epoch, second = divmod(now, 60)
+
+            if minute_epoch != self._cached_minute_epoch or self.current_time is None:
+                # Get current time in configured timezone (offsets only change
+                # on minute boundaries, so convert once per minute)
+                self.current_time = datetime.fromtimestamp(now, self.timezone)
+                self._cached_minute_epoch = minute_epoch
+            else:
+                # Same minute: only the seconds (separator flashing) advance
+                self.current_time = self.current_time.replace(second=second)
 
-            self.logger.debug(
-                f"Updated: time={self.current_time.strftime('%H:%M:%S')}"
-            )
+            # Only format the time when debug logging is actually enabled
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Updated: time=%s", self.current_time.strftime("%H:%M:%S")
+                )
 
         except Exception as e:
             self.logger.error(f"Error in update(): {e}", exc_info=True)
@@ -327,13 +441,17 @@ class SevenSegmentClockPlugin(BasePlugin):
         Returns:
             Scale factor (1.0 = no scaling, >1.0 = scale up, <1.0 = scale down)
         """
+        # The scale only depends on the display size and the layout shape
+        num_digits = sum(1 for item in digits if item != ":")
+        has_separator = ":" in digits
+        cache_key = (display_width, display_height, num_digits, has_separator)
+        if cache_key in self._scale_cache:
+            return self._scale_cache[cache_key]
+
         # Calculate base width needed for the time string
-        base_width = 0
-        for item in digits:
-            if item == ":":
-                base_width += self.separator_width
-            elif item is not None:
-                base_width += self.digit_width
+        base_width = num_digits * self.digit_width
+        if has_separator:
+            base_width += self.separator_width
 
         base_height = self.digit_height
 
@@ -351,8 +469,76 @@ class SevenSegmentClockPlugin(BasePlugin):
         # Don't scale down below 0.5x or up beyond 3x to maintain readability
         scale = max(0.5, min(3.0, scale))
 
+        self._scale_cache[cache_key] = scale
         return scale
 
+    def _compose_frame(
+        self, digits: list, separator_visible: bool, scale: float
+    ) -> Image.Image:
+        """
+        Composite the colored digits and separator into a single frame.
+
+        Args:
+            digits: List of digits/separators to display
+            separator_visible: Whether the separator should be drawn
+            scale: Scale factor to apply to the images
+
+        Returns:
+            RGB frame sized to the scaled clock, black where nothing is lit
+        """
+        # Colored glyphs only need rendering when the color or scale changes
+        if (":", self.color, scale) not in self._render_cache:
+            self._build_render_cache(self.color, scale)
+
+        # Calculate scaled dimensions
+        scaled_digit_width = int(self.digit_width * scale)
+        scaled_digit_height = int(self.digit_height * scale)
+        scaled_separator_width = int(self.separator_width * scale)
+        scaled_separator_height = int(self.separator_height * scale)
+
+        # Calculate total width with scaling and spacing
+        # Add spacing between all elements (digits and separators) for uniform spacing
+        total_width = 0
+        for item in digits:
+            if item == ":":
+                total_width += scaled_separator_width
+            else:
+                total_width += scaled_digit_width
+        
+        # Add spacing between all elements (not before first or after last)
+        # Count gaps between all consecutive elements
+        if len(digits) > 1:
+            spacing_gaps = len(digits) - 1
+            total_width += spacing_gaps * int(self.digit_spacing * scale)
+
+        # Composite each digit/separator into a single frame with uniform
+        # spacing, then paste the frame onto the display once
+        frame = Image.new("RGB", (total_width, scaled_digit_height), (0, 0, 0))
+        current_x = 0
+        first_element = True
+        for item in digits:
+            # Add spacing before each element (except the first one) for uniform spacing
+            if not first_element:
+                current_x += int(self.digit_spacing * scale)
+            first_element = False
+            if item == ":":
+                # A hidden separator is left black, which clears its old pixels
+                sep_y = (scaled_digit_height - scaled_separator_height) // 2
+                
+                if separator_visible and self.separator_image:
+                    sep_img = self._render_cache[(":", self.color, scale)]
+                    if sep_img:
+                        frame.paste(sep_img, (current_x, sep_y))
+                
+                current_x += scaled_separator_width
+            else:
+                digit_img = self._render_cache[(item, self.color, scale)]
+                if digit_img:
+                    frame.paste(digit_img, (current_x, 0))
+                    current_x += scaled_digit_width
+
+        return frame
+
     def display(self, force_clear: bool = False) -> None:
         """Render the 7-segment clock display."""
         try:
@@ -362,7 +548,12 @@ class SevenSegmentClockPlugin(BasePlugin):
 
             # Format time string
             time_str, separator_visible = self._format_time(self.current_time)
-            
+
+            # Nothing visible changed since the last render, so skip it entirely
+            render_key = (time_str, separator_visible, self.color)
+            if not force_clear and not self.first_display and render_key == self.last_render_key:
+                return
+
             # Check if time has changed (only compare HH:MM, not seconds)
             time_changed = (time_str != self.last_displayed_time_str)
             
@@ -380,99 +571,44 @@ class SevenSegmentClockPlugin(BasePlugin):
             display_width = self.display_manager.width
             display_height = self.display_manager.height
 
-            # Calculate total width of time display
-            # Always include separator position to ensure we can clear it when hidden
-            digits = []
-            for char in time_str:
-                if char == ":":
-                    # Always include separator position, track visibility separately
-                    digits.append(":")
-                elif char.isdigit():
-                    digits.append(int(char))
-
-            # Safety check: ensure we have at least some digits to display
-            if not any(item is not None for item in digits):
-                self.logger.warning("No digits to display, skipping render")
-                return
-
-            # Calculate optimal scale factor to fit the display
-            scale = self._calculate_scale_factor(display_width, display_height, digits)
+            # Reuse the composed frame for this time, separator state and color;
+            # the digit layout and scale only need working out on a miss
+            frame_key = (time_str, separator_visible, self.color, display_width, display_height)
+            frame = self._frame_cache.get(frame_key)
+            if frame is None:
+                # Always include separator position to ensure we can clear it when hidden
+                digits = [":" if char == ":" else int(char) for char in time_str]
+
+                # Calculate optimal scale factor to fit the display
+                scale = self._calculate_scale_factor(display_width, display_height, digits)
+
+                frame = self._compose_frame(digits, separator_visible, scale)
+                self._frame_cache[frame_key] = frame
+                if len(self._frame_cache) > self._FRAME_CACHE_SIZE:
+                    self._frame_cache.popitem(last=False)
+            else:
+                self._frame_cache.move_to_end(frame_key)
 
-            # Calculate scaled dimensions
-            scaled_digit_width = int(self.digit_width * scale)
-            scaled_digit_height = int(self.digit_height * scale)
-            scaled_separator_width = int(self.separator_width * scale)
-            scaled_separator_height = int(self.separator_height * scale)
+            # Center the frame on the display
+            start_x = (display_width - frame.width) // 2
+            start_y = (display_height - frame.height) // 2
 
-            # Calculate total width with scaling and spacing
-            # Add spacing between all elements (digits and separators) for uniform spacing
-            total_width = 0
-            element_count = sum(1 for item in digits if item is not None)
-            
-            for item in digits:
-                if item == ":":
-                    total_width += scaled_separator_width
-                elif item is not None:
-                    total_width += scaled_digit_width
-            
-            # Add spacing between all elements (not before first or after last)
-            # Count gaps between all consecutive elements
-            if element_count > 1:
-                spacing_gaps = element_count - 1
-                total_width += spacing_gaps * int(self.digit_spacing * scale)
-
-            # Calculate starting X position to center the display
-            start_x = (display_width - total_width) // 2
-            # Center vertically
-            start_y = (display_height - scaled_digit_height) // 2
-
-            # Render each digit/separator with scaling and spacing
-            # Add uniform spacing between all elements (digits and separators)
-            current_x = start_x
-            first_element = True
-            for item in digits:
-                if item is None:
-                    continue
-                
-                # Add spacing before each element (except the first one) for uniform spacing
-                if not first_element:
-                    current_x += int(self.digit_spacing * scale)
-                first_element = False
-                if item == ":":
-                    # Always paste something in separator position to clear old pixels
-                    paste_y = start_y + (scaled_digit_height - scaled_separator_height) // 2
-                    
-                    if separator_visible and self.separator_image:
-                        # Render and paste visible separator
-                        sep_img = self._render_separator(self.color, scale)
-                        if sep_img:
-                            self.display_manager.image.paste(
-                                sep_img, (current_x, paste_y), sep_img
-                            )
-                    else:
-                        # Clear separator area by pasting a black image
-                        # Create a black RGB image (not RGBA) to fully overwrite old pixels
-                        clear_img = Image.new("RGB", (scaled_separator_width, scaled_separator_height), (0, 0, 0))
-                        self.display_manager.image.paste(
-                            clear_img, (current_x, paste_y)
-                        )
-                    
-                    current_x += scaled_separator_width
-                else:
-                    # Render digit
-                    digit_img = self._render_digit(item, self.color, scale)
-                    if digit_img:
-                        # Paste onto display image with alpha blending
-                        self.display_manager.image.paste(
-                            digit_img, (current_x, start_y), digit_img
-                        )
-                        current_x += scaled_digit_width
+            # Paste onto display image; the opaque frame overwrites the whole
+            # clock area, so no alpha blending is needed
+            self.display_manager.image.paste(frame, (start_x, start_y))
 
             # Update the display
             self.display_manager.update_display()
 
+            # Only remember the frame once it actually made it to the display
+            self.last_render_key = render_key
+
         except Exception as e:
             self.logger.error(f"Error in display(): {e}", exc_info=True)
+            # Force a full redraw (including a clear) on the next call so the
+            # error text doesn't stay up until the time changes
+            self.last_render_key = None
+            self.last_displayed_time_str = None
             # Show error on display
             self.display_manager.clear()
             self.display_manager.draw_text(
@@ -484,20 +620,27 @@ class SevenSegmentClockPlugin(BasePlugin):
             self.display_manager.update_display()
 
     def validate_config(self) -> bool:
-        """Validate plugin configuration."""
+        """Validate plugin configuration (checked once; later calls reuse the result)."""
+        if self._config_valid is not None:
+            return self._config_valid
+
         # Check color
         color = self.config.get("color", "#FFFFFF")
         if not isinstance(color, str) or not color.startswith("#"):
             self.logger.warning("color should be a hex color (e.g., #FFFFFF)")
 
+        # Check resample filter
+        resample = self.config.get("resample", "nearest")
+        if not isinstance(resample, str) or resample not in RESAMPLE_FILTERS:
+            self.logger.warning(f"Unknown resample '{resample}', using nearest")
+
         # Check timezone if location config is provided (optional - will inherit from main config if not specified)
         location = self.config.get("location", {})
         if isinstance(location, dict) and "timezone" in location:
             timezone_str = location.get("timezone")
-            try:
-                pytz.timezone(timezone_str)
-            except pytz.exceptions.UnknownTimeZoneError:
+            if self._resolve_timezone(timezone_str) is None:
                 self.logger.warning(f"Unknown timezone '{timezone_str}', will fall back to main config or UTC")
 
-        return True
+        self._config_valid = True
+        return self._config_valid
 